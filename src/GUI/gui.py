@@ -6,12 +6,22 @@ sys.path.append('/media/henning/Volume/Programming/macrotrading/src')
 from NewsFeed.newsfeed import NewsFeed
 import webbrowser
 
+# Sentiment labels matched by each search filter option
+SENTIMENT_FILTERS = {
+    "All": None,
+    "Bullish": ["Bullish", "Somewhat-Bullish"],
+    "Neutral": ["Neutral"],
+    "Bearish": ["Bearish", "Somewhat-Bearish"]
+}
+
 class GUI():
     def __init__(self, news_feed):
         self.news_feed = news_feed
 
         self.search_entry = None
         self.source_var = None
+        self.sentiment_var = None
+        self.archive_var = None
         self.date_entry = None
         self.limit_var = None
         self.results_display = None
@@ -86,7 +96,7 @@ class GUI():
             # Insert each part with appropriate formatting
             self.news_display.insert(
                 tk.END,
-                f"{self.format_date(article['published_at'])} | {article['source']}\n",
+                f"{self.format_date(article['published_at'])} | {article['source']} | {article.get('sentiment_label') or 'Unscored'}\n",
                 'article'
             )
             self.news_display.insert(tk.END, f"{title}\n", 'article')
@@ -209,6 +219,31 @@ class GUI():
         tk.OptionMenu(
             filters_frame, self.source_var, *sources
         ).grid(row=0, column=1, sticky="w")
+
+        # Sentiment Filter
+        tk.Label(
+            filters_frame,
+            text="Sentiment:",
+            bg="black", fg="orange"
+        ).grid(row=3, column=0, padx=(0,5), pady=(10,0), sticky="w")
+
+        self.sentiment_var = tk.StringVar(value="All")
+        sentiment_menu = tk.OptionMenu(
+            filters_frame, self.sentiment_var, *SENTIMENT_FILTERS.keys()
+        )
+        sentiment_menu.config(bg="#333", fg="orange", highlightthickness=0)
+        sentiment_menu.grid(row=3, column=1, pady=(10,0), sticky="w")
+
+        # Archive Filter
+        self.archive_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            filters_frame,
+            text="Include archived articles",
+            variable=self.archive_var,
+            bg="black", fg="orange",
+            selectcolor="#222",
+            activebackground="black"
+        ).grid(row=4, column=0, columnspan=2, pady=(10,0), sticky="w")
         
         # Date Filter
         tk.Label(
@@ -286,6 +321,7 @@ class GUI():
             # Get filters
             source = None if self.source_var.get() == "All" else self.source_var.get()
             limit = self.limit_var.get()
+            sentiment_labels = SENTIMENT_FILTERS[self.sentiment_var.get()]
             
             # Parse date (if provided)
             date_str = self.date_entry.get().strip()
@@ -303,7 +339,9 @@ class GUI():
                 search_term=query,
                 limit=limit,
                 source=source,
-                after_date=after_date
+                after_date=after_date,
+                sentiment_labels=sentiment_labels,
+                include_archive=self.archive_var.get()
             )
             
             # Display results with clickable URLs
@@ -317,7 +355,7 @@ class GUI():
                     # Insert article content
                     self.results_display.insert(
                         tk.END,
-                        f"[{article['source']}] {article['published_at'][:10]}\n"
+                        f"[{article['source']}] {article['published_at'][:10]} {article.get('sentiment_label') or ''}\n"
                         f"{article['title']}\n"
                         f"{'-'*50}\n"
                         f"{article['description'][:200]}...\n",
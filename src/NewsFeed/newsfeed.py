@@ -6,68 +6,287 @@ import os
 from dotenv import load_dotenv
 import feedparser
 import sqlite3
-from datetime import datetime
+import re
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from dateutil import parser
 import pytz
+from concurrent.futures import ProcessPoolExecutor
+try:
+    from .sentiment import score_batch
+except ImportError:
+    from sentiment import score_batch
+
+
+# Length of the ISO timestamp prefix that identifies a time bucket
+GRANULARITIES = {"minute": 16, "hour": 13, "day": 10}
+
+# strptime format of a bucket and the step to the next one
+BUCKET_STEPS = {
+    "minute": ("%Y-%m-%dT%H:%M", timedelta(minutes=1)),
+    "hour": ("%Y-%m-%dT%H", timedelta(hours=1)),
+    "day": ("%Y-%m-%d", timedelta(days=1))
+}
+
+# Topic keywords counted in the news_rollups table. "All" counts every article.
+TOPICS = {
+    "Fed": re.compile(r"\b(fed|federal reserve|fomc|powell)\b", re.IGNORECASE),
+    "CPI": re.compile(r"\b(cpi|consumer price)", re.IGNORECASE),
+    "Inflation": re.compile(r"\binflation", re.IGNORECASE),
+    "Unemployment": re.compile(r"\b(unemployment|jobless|payrolls?)\b", re.IGNORECASE),
+    "GDP": re.compile(r"\b(gdp|gross domestic product)\b", re.IGNORECASE),
+    "Rates": re.compile(r"\b(interest rates?|rate (hike|cut)s?|yields?)\b", re.IGNORECASE)
+}
+
+# Shared by the hot database and the monthly archives
+ARTICLES_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        source TEXT NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT,
+        content TEXT,
+        url TEXT UNIQUE NOT NULL,
+        published_at TIMESTAMP,
+        retrieved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        category TEXT,
+        sentiment_score REAL,
+        sentiment_label TEXT,
+        sentiment_source TEXT
+    )
+"""
+
+# Adds one article's count and sentiment to a rollup row
+ROLLUP_UPSERT = """
+    INSERT INTO news_rollups (granularity, topic, bucket, source, count, sentiment_sum, sentiment_n)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (granularity, topic, bucket, source) DO UPDATE SET
+        count = count + excluded.count,
+        sentiment_sum = sentiment_sum + excluded.sentiment_sum,
+        sentiment_n = sentiment_n + excluded.sentiment_n
+"""
 
 
 
 class NewsFeed():
-    def __init__(self, db_name: str = "news_feed.db"):
+    def __init__(self, db_name: str = "news_feed.db", sentiment_workers: int = None, sentiment_batch_size: int = 200,
+                 retention_days: int = 90, archive_dir: str = "news_archive"):
         load_dotenv()
         self.db_name = db_name
+        self.sentiment_workers = sentiment_workers
+        self.sentiment_batch_size = sentiment_batch_size
+        self.retention_days = retention_days
+        self.archive_dir = archive_dir
         self._initialize_database()
         self.get_macro_news_api()
         self.get_macro_news()
         self.get_marketaux_news()
         self.get_alphavantage_news()
         self.get_fred_news()
+        self._score_new_articles()
+        self.apply_retention()
     
 
     def _initialize_database(self):
         """Create database and tables if they don't exist"""
         with sqlite3.connect(self.db_name) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    source TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    content TEXT,
-                    url TEXT UNIQUE NOT NULL,
-                    published_at TIMESTAMP,
-                    retrieved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    category TEXT
-                )
-            """)
+            # Incremental auto-vacuum lets compact_database give freed pages back.
+            # Switching an existing database over needs a full VACUUM once.
+            if cursor.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                cursor.execute("VACUUM")
+            cursor.execute(ARTICLES_SCHEMA)
+            # Databases created before sentiment scoring lack these columns
+            existing = {row[1] for row in cursor.execute("PRAGMA table_info(articles)")}
+            for column, column_type in (("sentiment_score", "REAL"), ("sentiment_label", "TEXT"), ("sentiment_source", "TEXT")):
+                if column not in existing:
+                    cursor.execute(f"ALTER TABLE articles ADD COLUMN {column} {column_type}")
             # Index for faster searching
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_title ON articles(title)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_published ON articles(published_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sentiment ON articles(sentiment_score)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_label ON articles(sentiment_label)")
+            # Sentiment over time is served from news_rollups, this index is no longer used
+            cursor.execute("DROP INDEX IF EXISTS idx_published_sentiment")
+            # Article counts and sentiment totals per (granularity, topic, bucket, source),
+            # maintained on insert and scoring
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS news_rollups (
+                    granularity TEXT NOT NULL,
+                    topic TEXT NOT NULL,
+                    bucket TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    sentiment_sum REAL NOT NULL DEFAULT 0,
+                    sentiment_n INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (granularity, topic, bucket, source)
+                ) WITHOUT ROWID
+            """)
+            # Rollups created before sentiment was aggregated lack these columns
+            rollup_columns = {row[1] for row in cursor.execute("PRAGMA table_info(news_rollups)")}
+            sentiment_missing = "sentiment_sum" not in rollup_columns
+            if sentiment_missing:
+                cursor.execute("ALTER TABLE news_rollups ADD COLUMN sentiment_sum REAL NOT NULL DEFAULT 0")
+                cursor.execute("ALTER TABLE news_rollups ADD COLUMN sentiment_n INTEGER NOT NULL DEFAULT 0")
             conn.commit()
+
+            # Databases created before the rollups existed need a first build
+            rollups_empty = cursor.execute("SELECT 1 FROM news_rollups LIMIT 1").fetchone() is None
+            articles_exist = cursor.execute("SELECT 1 FROM articles LIMIT 1").fetchone() is not None
+        if (rollups_empty and articles_exist) or sentiment_missing:
+            self.rebuild_rollups()
     
 
     def _store_articles(self, articles: list[dict], source: str):
-        """Store articles in database, ignoring duplicates"""
+        """Store articles in database, ignoring duplicates and articles past the retention horizon"""
+        cutoff = self._retention_cutoff()
         with sqlite3.connect(self.db_name) as conn:
             cursor = conn.cursor()
             for article in articles:
+                published_at = article.get("published_at", datetime.now().isoformat())
+                if published_at < cutoff:
+                    # Already archived, storing it again would count it twice in the rollups
+                    continue
                 try:
+                    # Keep the provider's sentiment if it sent one
+                    sentiment_score = article.get("sentiment_score")
                     cursor.execute("""
                         INSERT INTO articles (
-                            source, title, description, content, url, published_at
-                        ) VALUES (?, ?, ?, ?, ?, ?)
+                            source, title, description, content, url, published_at,
+                            sentiment_score, sentiment_label, sentiment_source
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         source,
                         article["title"],
                         article.get("description"),
                         article.get("content"),
                         article["url"],
-                        article.get("published_at", datetime.now().isoformat())
+                        published_at,
+                        sentiment_score,
+                        article.get("sentiment_label"),
+                        source if sentiment_score is not None else None
                     ))
                 except sqlite3.IntegrityError:
                     # Skip duplicate URLs
                     continue
+                sentiment = (sentiment_score, 1) if sentiment_score is not None else (0.0, 0)
+                cursor.executemany(ROLLUP_UPSERT, [
+                    key + (1,) + sentiment
+                    for key in self._rollup_keys(source, article["title"], article.get("description"), published_at)
+                ])
+            conn.commit()
+
+
+    def _rollup_keys(self, source: str, title: str, description: str, published_at: str) -> list[tuple]:
+        """Return the (granularity, topic, bucket, source) rows one article counts towards"""
+        text = f"{title or ''} {description or ''}"
+        topics = ["All"] + [topic for topic, pattern in TOPICS.items() if pattern.search(text)]
+        return [
+            (granularity, topic, published_at[:length], source)
+            for granularity, length in GRANULARITIES.items()
+            for topic in topics
+        ]
+
+
+    def rebuild_rollups(self):
+        """Recompute the news_rollups table from scratch out of the articles table and the archives"""
+        query = """
+            SELECT source, title, description, published_at, sentiment_score
+            FROM articles WHERE published_at IS NOT NULL
+        """
+        # key -> [count, sentiment_sum, sentiment_n]
+        totals = {}
+
+        def add(rows):
+            for source, title, description, published_at, sentiment_score in rows:
+                for key in self._rollup_keys(source, title, description, published_at):
+                    total = totals.setdefault(key, [0, 0.0, 0])
+                    total[0] += 1
+                    if sentiment_score is not None:
+                        total[1] += sentiment_score
+                        total[2] += 1
+
+        for month in self._archive_months():
+            with self._archive_connection(month) as archive:
+                add(archive.execute(query))
+
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            add(cursor.execute(query))
+
+            cursor.execute("DELETE FROM news_rollups")
+            cursor.executemany(
+                """
+                    INSERT INTO news_rollups (granularity, topic, bucket, source, count, sentiment_sum, sentiment_n)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [key + tuple(total) for key, total in totals.items()]
+            )
+            self._prune_rollups(cursor, self._retention_cutoff())
+            conn.commit()
+
+
+    def _prune_rollups(self, cursor: sqlite3.Cursor, cutoff: str):
+        """
+        Drop minute rollups past the retention horizon. They hold roughly one
+        row per article and topic, while the hour and day rollups are kept
+        for the long term.
+        """
+        cursor.execute(
+            "DELETE FROM news_rollups WHERE granularity = 'minute' AND bucket < ?",
+            (cutoff[:GRANULARITIES["minute"]],)
+        )
+
+
+    def _score_new_articles(self):
+        """
+        Score every article that has no sentiment yet with the local lexicon.
+        Articles are scored in batches, spread over a process pool when there
+        is more than one batch.
+        """
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, source, title, description, content, published_at FROM articles
+                WHERE sentiment_score IS NULL
+            """)
+            rows = []
+            rollup_keys = {}
+            for article_id, source, title, description, content, published_at in cursor.fetchall():
+                rows.append((article_id, " ".join(part for part in (title, description, content) if part)))
+                rollup_keys[article_id] = self._rollup_keys(source, title, description, published_at)
+
+        if not rows:
+            return
+
+        batches = [rows[i:i + self.sentiment_batch_size] for i in range(0, len(rows), self.sentiment_batch_size)]
+        if len(batches) == 1:
+            # Not worth starting worker processes for a single batch
+            results = [score_batch(batches[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=self.sentiment_workers) as pool:
+                results = list(pool.map(score_batch, batches))
+
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            for scored in results:
+                cursor.executemany("""
+                    UPDATE articles
+                    SET sentiment_score = ?, sentiment_label = ?, sentiment_source = 'lexicon'
+                    WHERE id = ?
+                """, scored)
+                # The article was already counted on insert, only add its sentiment
+                cursor.executemany("""
+                    UPDATE news_rollups
+                    SET sentiment_sum = sentiment_sum + ?, sentiment_n = sentiment_n + 1
+                    WHERE granularity = ? AND topic = ? AND bucket = ? AND source = ?
+                """, [
+                    (score,) + key
+                    for score, _, article_id in scored
+                    for key in rollup_keys[article_id]
+                ])
             conn.commit()
 
 
@@ -149,7 +368,9 @@ class NewsFeed():
                         "description": article["summary"],
                         "content": "",
                         "url": article["url"],
-                        "published_at": self._parse_date(article["time_published"])
+                        "published_at": self._parse_date(article["time_published"]),
+                        "sentiment_score": self._parse_score(article.get("overall_sentiment_score")),
+                        "sentiment_label": article.get("overall_sentiment_label")
                     }
                 news.append(news_article)
 
@@ -187,6 +408,8 @@ class NewsFeed():
         self.get_marketaux_news()
         self.get_alphavantage_news()
         self.get_fred_news()
+        self._score_new_articles()
+        self.apply_retention()
 
         with sqlite3.connect(self.db_name) as conn:
             conn.row_factory = sqlite3.Row
@@ -199,40 +422,323 @@ class NewsFeed():
             return [dict(row) for row in cursor.fetchall()]
     
 
-    def search_articles(self, search_term: str, limit: int = 20, source: str = None, after_date: str = None) -> list[dict]:
+    def search_articles(self, search_term: str, limit: int = 20, source: str = None, after_date: str = None,
+                        min_sentiment: float = None, max_sentiment: float = None, sentiment_labels: list[str] = None,
+                        include_archive: bool = False) -> list[dict]:
         """
         Search articles across title, description, and content
         Returns articles containing the search term (case-insensitive)
+        With include_archive the monthly archives are searched too, newest first
         """
+        filters = (search_term, limit, source, after_date, min_sentiment, max_sentiment, sentiment_labels)
+        with sqlite3.connect(self.db_name) as conn:
+            results = self._search(conn, *filters)
+
+        if include_archive:
+            # Archives only hold articles older than the hot database, so stop
+            # as soon as enough results have been found
+            for month in reversed(self._archive_months()):
+                if len(results) >= limit or (after_date and month < after_date[:7]):
+                    break
+                with self._archive_connection(month) as archive:
+                    results += self._search(archive, *filters)
+
+            results.sort(key=lambda article: article["published_at"] or "", reverse=True)
+        return results[:limit]
+
+
+    def _search(self, conn: sqlite3.Connection, search_term: str, limit: int, source: str, after_date: str,
+                min_sentiment: float, max_sentiment: float, sentiment_labels: list[str]) -> list[dict]:
+        """Run the article search query against one database"""
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        query = """
+            SELECT * FROM articles 
+            WHERE 
+                (title LIKE ? OR 
+                description LIKE ? OR 
+                content LIKE ?)
+        """
+        params = [f"%{search_term}%"] * 3
+        
+        # Add optional filters
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+            
+        if after_date:
+            query += " AND published_at >= ?"
+            params.append(after_date)
+
+        if min_sentiment is not None:
+            query += " AND sentiment_score >= ?"
+            params.append(min_sentiment)
+
+        if max_sentiment is not None:
+            query += " AND sentiment_score <= ?"
+            params.append(max_sentiment)
+
+        if sentiment_labels:
+            query += f" AND sentiment_label IN ({', '.join('?' * len(sentiment_labels))})"
+            params.extend(sentiment_labels)
+            
+        query += " ORDER BY published_at DESC LIMIT ?"
+        params.append(limit)
+        
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+
+    def get_sentiment_over_time(self, granularity: str = "hour", source: str = None, after_date: str = None,
+                                topic: str = "All") -> list[dict]:
+        """
+        Average sentiment per time bucket, read from the rollups so archived
+        articles are included. granularity is one of "minute", "hour" or "day";
+        minute buckets only reach back to the retention horizon.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        if topic != "All" and topic not in TOPICS:
+            raise ValueError(f"Unknown topic: {topic}")
+        # Buckets are UTC timestamp prefixes, so compare against after_date in UTC
+        after_bucket = self._parse_date(after_date)[:GRANULARITIES[granularity]] if after_date else None
+
         with sqlite3.connect(self.db_name) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            
+
             query = """
-                SELECT * FROM articles 
-                WHERE 
-                    (title LIKE ? OR 
-                    description LIKE ? OR 
-                    content LIKE ?)
+                SELECT
+                    bucket,
+                    SUM(sentiment_sum) / SUM(sentiment_n) AS avg_sentiment,
+                    SUM(sentiment_n) AS articles
+                FROM news_rollups
+                WHERE granularity = ? AND topic = ?
             """
-            params = [f"%{search_term}%"] * 3
-            
-            # Add optional filters
+            params = [granularity, topic]
+
             if source:
                 query += " AND source = ?"
                 params.append(source)
-                
-            if after_date:
-                query += " AND published_at >= ?"
-                params.append(after_date)
-                
-            query += " ORDER BY published_at DESC LIMIT ?"
-            params.append(limit)
-            
+
+            if after_bucket:
+                query += " AND bucket >= ?"
+                params.append(after_bucket)
+
+            query += " GROUP BY bucket HAVING SUM(sentiment_n) > 0 ORDER BY bucket"
+
             cursor.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
     
 
+    def get_news_volume(self, topic: str = "All", granularity: str = "hour", source: str = None,
+                        after_date: str = None, by_source: bool = False, fill_gaps: bool = False) -> list[dict]:
+        """
+        Number of articles per time bucket for a topic, read from the rollups.
+        Counts are summed over all sources unless a source is given or
+        by_source is set, in which case every row also carries its source.
+        With fill_gaps every bucket from after_date (or the first bucket)
+        up to now is returned, with a count of 0 for quiet periods.
+        Minute buckets only reach back to the retention horizon.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        if topic != "All" and topic not in TOPICS:
+            raise ValueError(f"Unknown topic: {topic}")
+        # Buckets are UTC timestamp prefixes, so compare against after_date in UTC
+        after_bucket = self._parse_date(after_date)[:GRANULARITIES[granularity]] if after_date else None
+
+        with sqlite3.connect(self.db_name) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+
+            columns = "bucket, source" if by_source else "bucket"
+            query = f"""
+                SELECT {columns}, SUM(count) AS count
+                FROM news_rollups
+                WHERE granularity = ? AND topic = ?
+            """
+            params = [granularity, topic]
+
+            if source:
+                query += " AND source = ?"
+                params.append(source)
+
+            if after_bucket:
+                query += " AND bucket >= ?"
+                params.append(after_bucket)
+
+            query += f" GROUP BY {columns} ORDER BY {columns}"
+
+            cursor.execute(query, params)
+            rows = [dict(row) for row in cursor.fetchall()]
+
+        if not fill_gaps:
+            return rows
+
+        bucket_format = BUCKET_STEPS[granularity][0]
+        first = after_bucket or (rows[0]["bucket"] if rows else None)
+        if first is None:
+            return []
+        last = max([datetime.now(pytz.UTC).strftime(bucket_format)] + [row["bucket"] for row in rows])
+
+        counts = {(row["bucket"], row.get("source")): row["count"] for row in rows}
+        sources = sorted({row["source"] for row in rows}) if by_source else [None]
+        if by_source and source and not sources:
+            sources = [source]
+
+        filled = []
+        for bucket in self._bucket_range(granularity, first, last):
+            for row_source in sources:
+                row = {"bucket": bucket, "source": row_source} if by_source else {"bucket": bucket}
+                row["count"] = counts.get((bucket, row_source), 0)
+                filled.append(row)
+        return filled
+
+
+    def _bucket_range(self, granularity: str, first: str, last: str) -> list[str]:
+        """All buckets of a granularity from first to last, both included"""
+        bucket_format, step = BUCKET_STEPS[granularity]
+        current = datetime.strptime(first, bucket_format)
+        end = datetime.strptime(last, bucket_format)
+        buckets = []
+        while current <= end:
+            buckets.append(current.strftime(bucket_format))
+            current += step
+        return buckets
+
+
+    def apply_retention(self):
+        """
+        Archive articles past the retention horizon and compact the hot database if anything moved.
+        Without zstandard installed archiving is skipped so fetching keeps working.
+        """
+        try:
+            archived = self.archive_old_articles()
+        except ImportError:
+            # Nothing is deleted before the archives are written, so the articles stay in the hot database
+            return
+        if archived:
+            self.compact_database()
+
+
+    def _retention_cutoff(self) -> str:
+        """
+        Start of the month that contains the retention horizon.
+        Only whole months are archived, so each archive is written once
+        and articles are kept for at least retention_days.
+        """
+        horizon = datetime.now(pytz.UTC) - timedelta(days=self.retention_days)
+        return horizon.strftime("%Y-%m-01T00:00:00Z")
+
+
+    def archive_old_articles(self) -> int:
+        """
+        Move articles from months entirely past the retention horizon into
+        zstd-compressed monthly archive databases and delete them from the
+        hot database. Hour and day rollups are left untouched so volume and
+        sentiment history is kept, minute rollups are pruned.
+        Returns the number of archived articles.
+        """
+        cutoff = self._retention_cutoff()
+
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM articles WHERE published_at < ? ORDER BY published_at", (cutoff,))
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+            if not rows:
+                return 0
+
+            months = {}
+            published_index = columns.index("published_at")
+            for row in rows:
+                months.setdefault(row[published_index][:7], []).append(row)
+
+            insert = f"INSERT OR IGNORE INTO articles ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+            for month, month_rows in months.items():
+                with self._archive_connection(month, write=True) as archive:
+                    archive.executemany(insert, month_rows)
+
+            # Only delete once every archive has been written, and only the rows
+            # that were archived, in case another connection inserted since the SELECT
+            id_index = columns.index("id")
+            cursor.execute("BEGIN")
+            cursor.executemany("DELETE FROM articles WHERE id = ?", [(row[id_index],) for row in rows])
+            self._prune_rollups(cursor, cutoff)
+            conn.commit()
+            return len(rows)
+
+
+    def compact_database(self):
+        """Return free pages to the file system and refresh the query planner statistics"""
+        with sqlite3.connect(self.db_name) as conn:
+            # incremental_vacuum frees one page per step; executescript steps it to completion
+            conn.executescript("PRAGMA incremental_vacuum")
+            conn.execute("ANALYZE")
+            conn.commit()
+
+
+    def _archive_path(self, month: str) -> str:
+        return os.path.join(self.archive_dir, f"articles_{month}.db.zst")
+
+
+    def _archive_months(self) -> list[str]:
+        """Months (YYYY-MM) that have an archive file, oldest first"""
+        if not os.path.isdir(self.archive_dir):
+            return []
+        return sorted(
+            name[len("articles_"):-len(".db.zst")]
+            for name in os.listdir(self.archive_dir)
+            if name.startswith("articles_") and name.endswith(".db.zst")
+        )
+
+
+    @contextmanager
+    def _archive_connection(self, month: str, write: bool = False):
+        """
+        Open a monthly archive as a decompressed temporary SQLite database.
+        With write=True the archive is created if missing and recompressed
+        on exit. The archive file is only replaced once it has been written.
+        """
+        # Only needed once there is something to archive
+        import zstandard
+
+        path = self._archive_path(month)
+        fd, tmp_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        try:
+            if os.path.exists(path):
+                with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+                    zstandard.ZstdDecompressor().copy_stream(src, dst)
+
+            conn = sqlite3.connect(tmp_path)
+            try:
+                conn.execute(ARTICLES_SCHEMA)
+                yield conn
+                if write:
+                    conn.commit()
+            finally:
+                conn.close()
+
+            if write:
+                os.makedirs(self.archive_dir, exist_ok=True)
+                with open(tmp_path, "rb") as src, open(path + ".tmp", "wb") as dst:
+                    zstandard.ZstdCompressor(level=10).copy_stream(src, dst)
+                os.replace(path + ".tmp", path)
+        finally:
+            os.remove(tmp_path)
+
+
+    def _parse_score(self, score) -> float:
+        """Convert a provider sentiment score to float, None if missing or invalid"""
+        try:
+            return float(score)
+        except (ValueError, TypeError):
+            return None
+
+
     def _parse_date(self, date_str: str) -> str:
         """
         Parse various date formats into standardized ISO 8601 format.
@@ -257,7 +763,9 @@ class NewsFeed():
             return datetime.now().isoformat() + "Z"
 
 
-test = NewsFeed()
+if __name__ == "__main__":
+    # Guarded so sentiment worker processes can import this module safely
+    test = NewsFeed()
 #test.get_fred_news()
 #print(x[0])
 #x = test.get_macro_news_api()
@@ -0,0 +1,83 @@
+import math
+import re
+
+
+# Small finance-oriented lexicon. Positive values are bullish, negative bearish.
+LEXICON = {
+    # bullish
+    "beat": 1.5, "beats": 1.5, "boom": 2.0, "booming": 2.0, "boost": 1.5, "boosts": 1.5,
+    "bullish": 2.5, "climb": 1.0, "climbs": 1.0, "cool": 0.5, "cooling": 1.0, "easing": 1.0,
+    "expand": 1.0, "expansion": 1.5, "gain": 1.5, "gains": 1.5, "growth": 1.5, "higher": 0.5,
+    "improve": 1.5, "improved": 1.5, "improves": 1.5, "jump": 1.5, "jumps": 1.5,
+    "optimism": 2.0, "optimistic": 2.0, "outperform": 2.0, "positive": 1.5, "profit": 1.5,
+    "rally": 2.0, "rallies": 2.0, "rebound": 1.5, "record": 1.0, "recovery": 1.5,
+    "rise": 1.0, "rises": 1.0, "robust": 1.5, "soar": 2.5, "soars": 2.5, "solid": 1.0,
+    "stable": 1.0, "strong": 1.5, "stronger": 1.5, "surge": 2.0, "surges": 2.0,
+    "upbeat": 2.0, "upgrade": 2.0, "upside": 1.0,
+    # bearish
+    "bearish": -2.5, "collapse": -3.0, "concern": -1.5, "concerns": -1.5, "contraction": -2.0,
+    "crash": -3.0, "crisis": -3.0, "cut": -0.5, "decline": -1.5, "declines": -1.5,
+    "default": -2.5, "deficit": -1.0, "downgrade": -2.0, "downside": -1.0, "drop": -1.5,
+    "drops": -1.5, "fall": -1.5, "falls": -1.5, "fear": -2.0, "fears": -2.0, "hike": -0.5,
+    "layoffs": -2.0, "lower": -0.5, "loss": -1.5, "losses": -1.5, "miss": -1.5,
+    "misses": -1.5, "negative": -1.5, "plunge": -2.5, "plunges": -2.5, "pressure": -1.0,
+    "recession": -2.5, "risk": -1.0, "risks": -1.0, "selloff": -2.0, "shock": -2.0,
+    "slowdown": -2.0, "slump": -2.0, "stagflation": -2.5, "tumble": -2.0, "tumbles": -2.0,
+    "turmoil": -2.5, "uncertainty": -1.5, "unemployment": -0.5, "volatile": -1.0,
+    "volatility": -1.0, "weak": -1.5, "weaker": -1.5, "worries": -1.5, "worry": -1.5,
+}
+
+NEGATIONS = {"not", "no", "never", "without", "isn't", "wasn't", "don't", "doesn't", "didn't", "won't"}
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+def sentiment_label(score: float) -> str:
+    """Map a score in [-1, 1] to the labels used by Alpha Vantage"""
+    if score <= -0.35:
+        return "Bearish"
+    if score <= -0.15:
+        return "Somewhat-Bearish"
+    if score < 0.15:
+        return "Neutral"
+    if score < 0.35:
+        return "Somewhat-Bullish"
+    return "Bullish"
+
+
+def score_text(text: str) -> float:
+    """
+    Score a piece of text with the lexicon.
+    A negation flips the polarity of the next three tokens.
+    Returns a value in [-1, 1], 0.0 for empty or neutral text.
+    """
+    if not text:
+        return 0.0
+
+    total = 0.0
+    negate_window = 0
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in NEGATIONS:
+            negate_window = 3
+            continue
+        value = LEXICON.get(token)
+        if value is not None:
+            total += -value if negate_window else value
+        if negate_window:
+            negate_window -= 1
+
+    # Normalize into [-1, 1] the same way VADER does
+    return total / math.sqrt(total * total + 15)
+
+
+def score_batch(batch: list[tuple[int, str]]) -> list[tuple[float, str, int]]:
+    """
+    Score a batch of (article_id, text) pairs.
+    Returns (score, label, article_id) rows ready for an UPDATE executemany.
+    Kept at module level so it can be sent to worker processes.
+    """
+    results = []
+    for article_id, text in batch:
+        score = round(score_text(text), 4)
+        results.append((score, sentiment_label(score), article_id))
+    return results